@@ -0,0 +1,69 @@
+"""
+Scorecard scoring kernels.
+"""
+
+# Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
+# Copyright (C) 2021
+
+import numpy as np
+
+from joblib import delayed
+from joblib import effective_n_jobs
+from joblib import Parallel
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(nogil=True, cache=True, fastmath=True)
+    def _score_kernel(indices, points, offsets, sizes, out):
+        for i in range(indices.shape[0]):
+            s = 0.0
+            for j in range(indices.shape[1]):
+                k = indices[i, j]
+                if k < 0:
+                    k += sizes[j]
+                s += points[offsets[j] + k]
+            out[i] = s
+
+
+def _score_chunk(indices, points, offsets, sizes):
+    if NUMBA_AVAILABLE:
+        out = np.empty(indices.shape[0], dtype=points.dtype)
+        _score_kernel(indices, points, offsets, sizes, out)
+        return out
+
+    positions = indices + offsets
+    # Negative indices wrap around within each variable's points
+    positions += np.where(indices < 0, sizes, 0).astype(positions.dtype)
+
+    return np.take(points, positions).sum(axis=1)
+
+
+def score_points(indices, points, offsets, n_jobs=None):
+    """Compute the sum of points for each sample given the bin indices of
+    each variable. Points of all variables are stored in a flat array, where
+    offsets[j] is the position of the first point of variable j. The numba
+    kernel is used if available, otherwise fall back to a numpy gather.
+    Negative bin indices (e.g. -1 for unseen categories) refer to the last
+    points of each variable.
+
+    If n_jobs > 1, samples are split into row blocks scored in parallel
+    threads. Both the numba kernel and the numpy operations release the GIL.
+    """
+    n_jobs = effective_n_jobs(n_jobs)
+    sizes = np.diff(np.append(offsets, len(points))).astype(offsets.dtype)
+
+    if n_jobs == 1:
+        return _score_chunk(indices, points, offsets, sizes)
+
+    chunks = np.array_split(indices, n_jobs)
+    scores = Parallel(n_jobs=n_jobs, prefer="threads")(
+        delayed(_score_chunk)(chunk, points, offsets, sizes)
+        for chunk in chunks)
+
+    return np.concatenate(scores)
@@ -8,27 +8,48 @@ Rounding strategy.
 import numpy as np
 
 from ortools.linear_solver import pywraplp
+from scipy import sparse
+
+try:
+    from scipy.optimize import Bounds
+    from scipy.optimize import LinearConstraint
+    from scipy.optimize import milp
+    SCIPY_MILP_AVAILABLE = True
+except ImportError:
+    SCIPY_MILP_AVAILABLE = False
 
 
 class RoundingMIP:
-    def __init__(self):
+    def __init__(self, solver=None):
+        if solver is None:
+            solver = "highs" if SCIPY_MILP_AVAILABLE else "cbc"
+
+        if solver not in ("highs", "cbc"):
+            raise ValueError('Invalid value for solver. Allowed string '
+                             'values are "highs" and "cbc".')
+
+        if solver == "highs" and not SCIPY_MILP_AVAILABLE:
+            raise ImportError('Cannot import scipy.optimize.milp. Install '
+                              'scipy>=1.9 or choose solver "cbc".')
+
+        self.solver = solver
+
         self.solver_ = None
 
         self._nb = None
         self._nn = None
         self._p = None
+        self._min_point = None
+        self._max_point = None
+        self._min_p = None
+        self._max_p = None
 
     def build_model(self, df_scorecard):
         # Parameters
-        points = []
-        mins = []
-        maxs = []
-        for variable in df_scorecard.Variable.unique():
-            mask = df_scorecard.Variable == variable
-            p = df_scorecard[mask].Points.values
-            mins.append(p.min())
-            maxs.append(p.max())
-            points.append(p)
+        points = [group.to_numpy() for _, group in df_scorecard.groupby(
+            "Variable", sort=False)["Points"]]
+        mins = [p.min() for p in points]
+        maxs = [p.max() for p in points]
 
         nb = len(points)
         nn = [len(p) for p in points]
@@ -39,6 +60,147 @@ class RoundingMIP:
         min_p = np.min(mins)
         max_p = np.max(maxs)
 
+        if self.solver == "highs":
+            self._build_model_highs(points, nb, nn, min_point, max_point,
+                                    min_p, max_p)
+        else:
+            self._build_model_cbc(points, nb, nn, min_point, max_point,
+                                  min_p, max_p)
+
+        self._nb = nb
+        self._nn = nn
+        self._min_point = min_point
+        self._max_point = max_point
+        self._min_p = min_p
+        self._max_p = max_p
+
+    def solve(self, warm_start=None):
+        # A feasible warm start given by the nearest integer of each point is
+        # optimal, since it minimizes each absolute deviation independently.
+        if warm_start is not None and self._is_feasible(warm_start):
+            # Adding zero turns negative zeros from rounding into zeros
+            solution = np.asarray(warm_start, dtype=float) + 0.0
+            return "OPTIMAL", list(solution)
+
+        if self.solver == "highs":
+            return self._solve_highs()
+        else:
+            return self._solve_cbc()
+
+    def _is_feasible(self, solution):
+        p = np.asarray(solution, dtype=float)
+
+        if len(p) != sum(self._nn) or not np.array_equal(p, np.rint(p)):
+            return False
+
+        if p.min() < self._min_p or p.max() > self._max_p:
+            return False
+
+        # Minimum/maximum score after rounding must be min_point/max_point,
+        # taking min_b and max_b as the minimum and maximum of each variable.
+        offsets = np.concatenate([[0], np.cumsum(self._nn)[:-1]])
+        sum_min = np.minimum.reduceat(p, offsets).sum()
+        sum_max = np.maximum.reduceat(p, offsets).sum()
+
+        return sum_min == self._min_point and sum_max == self._max_point
+
+    def _build_model_highs(self, points, nb, nn, min_point, max_point, min_p,
+                           max_p):
+        # Decision variables are stored as [p, tp, tm, min_b, max_b], where
+        # p, tp and tm have one entry per bin and min_b, max_b one entry per
+        # variable.
+        n = sum(nn)
+        n_vars = 3 * n + 2 * nb
+
+        ip = np.arange(n)
+        itp = n + ip
+        itm = 2 * n + ip
+        imin = 3 * n + np.repeat(np.arange(nb), nn)
+        imax = 3 * n + nb + np.repeat(np.arange(nb), nn)
+
+        # Objective function
+        c = np.zeros(n_vars)
+        c[n:3 * n] = 1
+
+        # Constraints
+        # tp - tm == points - p
+        rows = [ip, ip, ip]
+        cols = [ip, itp, itm]
+        vals = [np.ones(n), np.ones(n), -np.ones(n)]
+
+        # Max score constraint for each variable: max_b - p >= 0
+        rows += [n + ip, n + ip]
+        cols += [imax, ip]
+        vals += [np.ones(n), -np.ones(n)]
+
+        # Min score constraint for each variable: p - min_b >= 0
+        rows += [2 * n + ip, 2 * n + ip]
+        cols += [ip, imin]
+        vals += [np.ones(n), -np.ones(n)]
+
+        # Sum of minimum/maximum point by variable must be min_point/max_point
+        rows += [np.full(nb, 3 * n), np.full(nb, 3 * n + 1)]
+        cols += [3 * n + np.arange(nb), 3 * n + nb + np.arange(nb)]
+        vals += [np.ones(nb), np.ones(nb)]
+
+        A = sparse.csr_matrix(
+            (np.concatenate(vals), (np.concatenate(rows),
+                                    np.concatenate(cols))),
+            shape=(3 * n + 2, n_vars))
+
+        b_points = np.concatenate(points)
+        lb = np.concatenate([b_points, np.zeros(2 * n),
+                             [min_point, max_point]])
+        ub = np.concatenate([b_points, np.full(2 * n, np.inf),
+                             [min_point, max_point]])
+
+        # Bounds and integrality
+        lb_x = np.zeros(n_vars)
+        ub_x = np.full(n_vars, np.inf)
+        lb_x[ip] = min_p
+        ub_x[ip] = max_p
+        lb_x[3 * n:] = min_p
+        ub_x[3 * n:] = max_p
+
+        integrality = np.zeros(n_vars)
+        integrality[ip] = 1
+        integrality[3 * n:] = 1
+
+        self.solver_ = {
+            "c": c,
+            "constraints": LinearConstraint(A, lb, ub),
+            "integrality": integrality,
+            "bounds": Bounds(lb_x, ub_x)
+        }
+
+    def _solve_highs(self):
+        res = milp(options={"disp": False}, **self.solver_)
+
+        if res.status == 0 or (res.status == 1 and res.x is not None):
+            if res.status == 0:
+                status_name = "OPTIMAL"
+            else:
+                status_name = "FEASIBLE"
+
+            # compute solution
+            n = sum(self._nn)
+            solution = list(np.rint(res.x[:n]) + 0.0)
+        else:
+            if res.status == 2:
+                status_name = "INFEASIBLE"
+            elif res.status == 3:
+                status_name = "UNBOUNDED"
+            elif res.status == 4:
+                status_name = "ABNORMAL"
+            else:
+                status_name = "UNKNOWN"
+
+            solution = None
+
+        return status_name, solution
+
+    def _build_model_cbc(self, points, nb, nn, min_point, max_point, min_p,
+                         max_p):
         # Initialize solver
         solver = pywraplp.Solver(
                 'RoundingMIP', pywraplp.Solver.CBC_MIXED_INTEGER_PROGRAMMING)
@@ -77,11 +239,9 @@ class RoundingMIP:
         solver.Add(solver.Sum([max_b[i] for i in range(nb)]) == max_point)
 
         self.solver_ = solver
-        self._nb = nb
-        self._nn = nn
         self._p = p
 
-    def solve(self):
+    def _solve_cbc(self):
         status = self.solver_.Solve()
 
         if status in (pywraplp.Solver.OPTIMAL, pywraplp.Solver.FEASIBLE):
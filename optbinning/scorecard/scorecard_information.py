@@ -18,6 +18,8 @@ scorecard_default_options = {
     "intercept_based": False,
     "reverse_scorecard": False,
     "rounding": False,
+    "score_dtype": "float64",
+    "n_jobs": None,
     "verbose": False
 }
 
@@ -5,10 +5,12 @@ Scorecard testing.
 # Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
 # Copyright (C) 2020
 
+import pickle
+
 import pandas as pd
 import numpy as np
 
-from pytest import approx, raises
+from pytest import approx, importorskip, raises
 
 from contextlib import redirect_stdout
 
@@ -78,6 +80,21 @@ def test_params():
                               estimator=estimator, rounding=1)
         scorecard.fit(df)
 
+    with raises(ValueError):
+        scorecard = Scorecard(target="target", binning_process=binning_process,
+                              estimator=estimator, score_dtype="int32")
+        scorecard.fit(df)
+
+    with raises(ValueError):
+        scorecard = Scorecard(target="target", binning_process=binning_process,
+                              estimator=estimator, n_jobs=1.5)
+        scorecard.fit(df)
+
+    with raises(ValueError):
+        scorecard = Scorecard(target="target", binning_process=binning_process,
+                              estimator=estimator, n_jobs=0)
+        scorecard.fit(df)
+
     with raises(TypeError):
         scorecard = Scorecard(target="target", binning_process=binning_process,
                               estimator=estimator, verbose=1)
@@ -396,6 +413,137 @@ def test_predict_score():
                                 608.27744027, 638.49988325], rel=1e-6)
 
 
+def test_score_n_jobs():
+    data = load_breast_cancer()
+    variable_names = data.feature_names
+    df = pd.DataFrame(data.data, columns=variable_names)
+    df["target"] = data.target
+
+    binning_process = BinningProcess(variable_names)
+    estimator = LogisticRegression()
+    scaling_method_params = {"min": 300.12, "max": 850.66}
+
+    scorecard = Scorecard(target="target", binning_process=binning_process,
+                          estimator=estimator, scaling_method="min_max",
+                          scaling_method_params=scaling_method_params,
+                          n_jobs=2).fit(df)
+
+    score = scorecard.score(df)
+
+    assert len(score) == len(df)
+    assert score[:5] == approx([652.16590046, 638.52659074, 669.56413105,
+                                608.27744027, 638.49988325], rel=1e-6)
+
+
+def test_score_old_pickle():
+    data = load_breast_cancer()
+    variable_names = data.feature_names
+    df = pd.DataFrame(data.data, columns=variable_names)
+    df["target"] = data.target
+
+    binning_process = BinningProcess(variable_names)
+    estimator = LogisticRegression()
+    scaling_method_params = {"min": 300.12, "max": 850.66}
+
+    scorecard = Scorecard(target="target", binning_process=binning_process,
+                          estimator=estimator, scaling_method="min_max",
+                          scaling_method_params=scaling_method_params).fit(df)
+
+    score = scorecard.score(df)
+    proba = scorecard.predict_proba(df)
+
+    # Remove attributes not available in scorecards pickled with < 0.11.0
+    for attr in ("score_dtype", "n_jobs", "_score_variables",
+                 "_intercept_scalar", "_points_flat", "_points_offsets"):
+        delattr(scorecard, attr)
+
+    scorecard = pickle.loads(pickle.dumps(scorecard))
+
+    assert scorecard.score_dtype == "float64"
+    assert scorecard.n_jobs is None
+    assert scorecard.score(df) == approx(score, rel=1e-12)
+    assert scorecard.predict_proba(df) == approx(proba, rel=1e-12)
+
+
+def test_score_float32():
+    data = load_breast_cancer()
+    variable_names = data.feature_names
+    df = pd.DataFrame(data.data, columns=variable_names)
+    df["target"] = data.target
+
+    binning_process = BinningProcess(variable_names)
+    estimator = LogisticRegression()
+    scaling_method_params = {"min": 300.12, "max": 850.66}
+
+    scorecard = Scorecard(target="target", binning_process=binning_process,
+                          estimator=estimator, scaling_method="min_max",
+                          scaling_method_params=scaling_method_params,
+                          score_dtype="float32").fit(df)
+
+    score = scorecard.score(df)
+
+    assert score.dtype == np.float32
+    assert score[:5] == approx([652.16590046, 638.52659074, 669.56413105,
+                                608.27744027, 638.49988325], rel=1e-5)
+
+
+def test_score_kernel_numba():
+    importorskip("numba")
+
+    from optbinning.scorecard import _score_kernels
+
+    rng = np.random.RandomState(0)
+    n_bins = [5, 3, 8, 4]
+    points = rng.uniform(-50, 50, sum(n_bins))
+    offsets = np.concatenate([[0], np.cumsum(n_bins[:-1])]).astype(np.int32)
+    sizes = np.array(n_bins, dtype=np.int32)
+    # Index -1 (unseen category) refers to the last point of each variable
+    indices = np.column_stack(
+        [rng.randint(-1, nb, 1000) for nb in n_bins]).astype(np.int32)
+
+    score_numba = np.empty(indices.shape[0])
+    _score_kernels._score_kernel(indices, points, offsets, sizes, score_numba)
+    score_numpy = np.take(points, np.where(indices < 0, indices + sizes,
+                                           indices) + offsets).sum(axis=1)
+
+    assert score_numba == approx(score_numpy, rel=1e-12)
+
+
+def test_score_unseen_category():
+    data = load_breast_cancer()
+    variable_names = list(data.feature_names[:5])
+    df = pd.DataFrame(data.data[:, :5], columns=variable_names)
+    df["cat"] = np.where(data.target == 1, "A", "B")
+    df.loc[::3, "cat"] = "C"
+    df["target"] = data.target
+
+    binning_process = BinningProcess(variable_names + ["cat"],
+                                     categorical_variables=["cat"])
+    estimator = LogisticRegression()
+    scaling_method_params = {"pdo": 20, "odds": 50, "scorecard_points": 600}
+    scorecard = Scorecard(target="target", binning_process=binning_process,
+                          estimator=estimator, scaling_method="pdo_odds",
+                          scaling_method_params=scaling_method_params,
+                          intercept_based=True)
+    scorecard.fit(df)
+
+    # Unseen categories are scored with the points of the Missing bin, which
+    # is the last bin of the variable.
+    df_unseen = df.head().copy()
+    df_unseen["cat"] = "Z"
+    df_missing = df.head().copy()
+    df_missing["cat"] = np.nan
+
+    score_unseen = scorecard.score(df_unseen)
+    score_missing = scorecard.score(df_missing)
+
+    assert score_unseen == approx(score_missing, rel=1e-12)
+
+    for n_jobs in (1, 2):
+        scorecard.n_jobs = n_jobs
+        assert scorecard.score(df_unseen) == approx(score_unseen, rel=1e-12)
+
+
 def test_information():
     data = load_breast_cancer()
     variable_names = data.feature_names
@@ -0,0 +1,106 @@
+"""
+Scorecard rounding testing.
+"""
+
+# Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
+# Copyright (C) 2021
+
+import pandas as pd
+import numpy as np
+
+from pytest import approx, mark, raises
+
+from optbinning.scorecard.rounding import RoundingMIP
+from optbinning.scorecard.rounding import SCIPY_MILP_AVAILABLE
+
+
+def _scorecard_table(points):
+    names = ["V{}".format(i) for i in range(len(points))]
+    sizes = [len(p) for p in points]
+
+    return pd.DataFrame({"Variable": np.repeat(names, sizes),
+                         "Points": np.concatenate(points)})
+
+
+def _check_constraints(df_scorecard, solution):
+    p = np.asarray(solution)
+    assert np.array_equal(p, np.rint(p))
+
+    grouped = df_scorecard.groupby("Variable", sort=False)["Points"]
+    min_point = np.rint(grouped.min().sum())
+    max_point = np.rint(grouped.max().sum())
+
+    rounded = pd.Series(p).groupby(df_scorecard["Variable"].to_numpy(),
+                                   sort=False)
+    assert rounded.min().sum() >= min_point
+    assert rounded.max().sum() <= max_point
+
+
+def _objective(df_scorecard, solution):
+    return np.abs(df_scorecard["Points"].to_numpy() - solution).sum()
+
+
+def test_params():
+    with raises(ValueError):
+        RoundingMIP(solver="glpk")
+
+
+@mark.skipif(not SCIPY_MILP_AVAILABLE,
+             reason="scipy.optimize.milp is not available")
+def test_highs_cbc():
+    rng = np.random.RandomState(42)
+
+    for _ in range(10):
+        n_variables = rng.randint(2, 8)
+        points = [rng.uniform(-20, 100, rng.randint(2, 8))
+                  for _ in range(n_variables)]
+        df_scorecard = _scorecard_table(points)
+
+        solutions = {}
+        for solver in ("highs", "cbc"):
+            round_mip = RoundingMIP(solver=solver)
+            round_mip.build_model(df_scorecard)
+            status, solution = round_mip.solve()
+
+            assert status == "OPTIMAL"
+            _check_constraints(df_scorecard, solution)
+            solutions[solver] = solution
+
+        obj_highs = _objective(df_scorecard, solutions["highs"])
+        obj_cbc = _objective(df_scorecard, solutions["cbc"])
+
+        assert obj_highs == approx(obj_cbc, rel=1e-6, abs=1e-6)
+
+
+def test_warm_start_feasible():
+    points = [np.array([0.1, 2.9]), np.array([0.2, 3.1]),
+              np.array([-0.2, 1.4])]
+    df_scorecard = _scorecard_table(points)
+
+    round_mip = RoundingMIP()
+    round_mip.build_model(df_scorecard)
+    # Nearest integer is feasible, the solver must not be called
+    round_mip.solver_ = None
+    warm_start = np.rint(df_scorecard["Points"].to_numpy())
+    status, solution = round_mip.solve(warm_start=warm_start)
+
+    assert status == "OPTIMAL"
+    assert solution == approx([0, 3, 0, 3, 0, 1])
+    assert not np.signbit(solution).any()
+    _check_constraints(df_scorecard, solution)
+
+
+def test_warm_start_infeasible():
+    points = [np.array([0.0, 5.2]), np.array([1.4, 3.3]),
+              np.array([1.4, 7.1])]
+    df_scorecard = _scorecard_table(points)
+
+    round_mip = RoundingMIP()
+    round_mip.build_model(df_scorecard)
+    # Nearest integer yields a minimum score of 2, but 3 is required
+    warm_start = np.rint(df_scorecard["Points"].to_numpy())
+    status, solution = round_mip.solve(warm_start=warm_start)
+
+    assert status == "OPTIMAL"
+    assert not np.array_equal(solution, warm_start)
+    _check_constraints(df_scorecard, solution)